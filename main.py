@@ -13,24 +13,163 @@ concatenating all content under docs/.
 
 from __future__ import annotations
 import argparse
-import io
+import codecs
+import collections
+import concurrent.futures
+import contextlib
+import gzip
+import http.client
+import multiprocessing
 import os
 import re
+import shutil
 import sys
+import tarfile
+import tempfile
+import threading
 import zipfile
+import urllib.error
 import urllib.request
+import zlib
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
 
 DEFAULT_INCLUDE_EXTS = {".md", ".mdx", ".txt"}
-DEFAULT_EXCLUDE_DIRS = {".git", ".gitbook", "node_modules", ".DS_Store", "__pycache__"}
+DEFAULT_EXCLUDE_DIRS = {
+    ".git", ".gitbook", "node_modules", ".DS_Store", "__pycache__",
+    ".venv", "venv", "dist", "build", "target", ".tox", ".mypy_cache", ".pytest_cache",
+}
 
 DEFAULT_GITHUB_TREE_URL = "https://github.com/zama-ai/fhevm/tree/main/docs"
 
+# Archives up to this size stay in memory; larger ones spill to a temp file.
+SPOOL_MAX_SIZE = 32 * 1024 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024
+# Archives at least this large are fetched as parallel byte ranges when the server allows it.
+RANGE_MIN_SIZE = 4 * 1024 * 1024
+RANGE_PARTS = 8
+# Concurrent file reads while building the combined document.
+READ_WORKERS = 32
+# Files handed to each worker process at a time when rendering with --jobs > 1.
+RENDER_CHUNKSIZE = 16
+
 # ---------------------------
 # GitHub download helpers
 # ---------------------------
 
+def default_cache_dir() -> Optional[Path]:
+    """
+    Directory for downloaded archives: $XDG_CACHE_HOME/zama-llm-docs or ~/.cache/zama-llm-docs.
+    Returns None if neither can be determined (e.g. no resolvable home directory).
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    try:
+        return (Path(base) if base else Path.home() / ".cache") / "zama-llm-docs"
+    except (RuntimeError, KeyError, OSError):
+        return None
+
+class _TeeReader:
+    """
+    Minimal read-only file wrapper that copies everything read from src into dst.
+    A failed write to dst only sets `failed`; reads from src carry on regardless.
+    """
+    def __init__(self, src: BinaryIO, dst: BinaryIO) -> None:
+        self._src = src
+        self._dst = dst
+        self.failed = False
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._src.read(size)
+        if not self.failed:
+            try:
+                self._dst.write(data)
+            except OSError:
+                self.failed = True
+        return data
+
+@contextlib.contextmanager
+def open_cached_url(url: str, cache_path: Optional[Path]) -> Iterator[BinaryIO]:
+    """
+    Open url for streaming reads, reusing cache_path if the server says it is unchanged.
+    A cached copy is revalidated with If-None-Match against its saved ETag (sidecar
+    '<cache_path>.etag'); a fresh response is written to the cache as it is consumed.
+    The cache is best-effort: if it cannot be written, the response is streamed uncached.
+    """
+    if cache_path is None:
+        with urllib.request.urlopen(url) as resp:
+            yield resp
+        return
+
+    etag_path = cache_path.with_name(cache_path.name + ".etag")
+    headers = {}
+    with contextlib.suppress(OSError):
+        if cache_path.is_file() and etag_path.is_file():
+            headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+    try:
+        resp = urllib.request.urlopen(urllib.request.Request(url, headers=headers))
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        e.close()
+        resp = None
+
+    if resp is None:
+        print(f"Using cached archive {cache_path}")
+        try:
+            with open(cache_path, "rb") as cached:
+                yield cached
+        except Exception:
+            # Drop a cached copy that failed to extract; otherwise every later run
+            # would get a 304 for it and fail the same way
+            with contextlib.suppress(OSError):
+                cache_path.unlink(missing_ok=True)
+                etag_path.unlink(missing_ok=True)
+            raise
+        return
+
+    part_path = cache_path.with_name(cache_path.name + ".part")
+    with resp:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            dst = open(part_path, "wb")
+        except OSError as e:
+            print(f"Warning: cannot write archive cache ({e}); continuing without it", file=sys.stderr)
+            yield resp
+            return
+
+        tee = _TeeReader(resp, dst)
+        complete = False
+        try:
+            yield tee
+            # The consumer may stop before EOF (e.g. tar padding); keep the cached copy whole
+            try:
+                while tee.read(COPY_CHUNK_SIZE):
+                    pass
+            except (OSError, http.client.HTTPException):
+                tee.failed = True
+            complete = True
+        finally:
+            try:
+                dst.close()
+            except OSError:
+                tee.failed = True
+            if not complete or tee.failed:
+                with contextlib.suppress(OSError):
+                    part_path.unlink(missing_ok=True)
+
+    if tee.failed:
+        print(f"Warning: could not write archive cache {cache_path}; it was not updated", file=sys.stderr)
+        return
+    try:
+        os.replace(part_path, cache_path)
+        etag = resp.headers.get("ETag")
+        if etag:
+            etag_path.write_text(etag, encoding="utf-8")
+        else:
+            etag_path.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Warning: could not update archive cache ({e})", file=sys.stderr)
+
 _TREE_URL_RE = re.compile(
     r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)/tree/(?P<branch>[^/]+)(?:/(?P<subpath>.*))?$"
 )
@@ -49,36 +188,152 @@ def parse_github_tree_url(url: str) -> Tuple[str, str, str, str]:
     subpath = (m.group("subpath") or "").strip("/")
     return owner, repo, branch, subpath
 
+def _ranged_content_length(url: str) -> Optional[int]:
+    """
+    Return the size of url if the server advertises byte-range support, else None.
+    """
+    req = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(req) as resp:
+            if resp.headers.get("Accept-Ranges", "").lower() != "bytes":
+                return None
+            length = resp.headers.get("Content-Length")
+    except OSError:
+        return None
+    return int(length) if length and length.isdigit() else None
+
+def _fetch_range(url: str, fd: int, lo: int, hi: int) -> bool:
+    """
+    Write bytes [lo, hi] of url into fd at offset lo. Returns False if the server ignored
+    the range or the request failed, so the caller can fall back to a single stream.
+    """
+    req = urllib.request.Request(url, headers={"Range": f"bytes={lo}-{hi}"})
+    try:
+        with urllib.request.urlopen(req) as resp:
+            if resp.status != 206:
+                return False
+            offset = lo
+            while chunk := resp.read(COPY_CHUNK_SIZE):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+    except (OSError, http.client.HTTPException):
+        return False
+    return offset == hi + 1
+
+def download_to_file(url: str, dst: BinaryIO) -> None:
+    """
+    Download url into the seekable file dst, leaving it positioned at the start.
+    Large archives are fetched as RANGE_PARTS concurrent byte ranges; otherwise
+    (or if the server does not honour ranges) the body is streamed over one connection.
+    """
+    size = _ranged_content_length(url) if hasattr(os, "pwrite") else None
+    if size is not None and size >= RANGE_MIN_SIZE:
+        part = -(-size // RANGE_PARTS)
+        ranges = [(lo, min(lo + part, size) - 1) for lo in range(0, size, part)]
+        dst.truncate(size)
+        fd = dst.fileno()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+            ok = all(ex.map(lambda r: _fetch_range(url, fd, *r), ranges))
+        if ok:
+            dst.seek(0)
+            return
+        dst.truncate(0)
+
+    dst.seek(0)
+    with urllib.request.urlopen(url) as resp:
+        shutil.copyfileobj(resp, dst, length=COPY_CHUNK_SIZE)
+    dst.seek(0)
+
 def download_and_extract_subdir_from_zip(zip_url: str, zip_root_prefix: str, subdir: str, dest: Path) -> None:
     """
     Download a repo ZIP and extract only files under subdir into dest.
     zip_root_prefix is usually '{repo}-{branch}/'.
     """
     dest.mkdir(parents=True, exist_ok=True)
-    with urllib.request.urlopen(zip_url) as resp:
-        data = resp.read()
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
-        # Normalize prefixes (ensure trailing slashes)
-        zip_root_prefix = zip_root_prefix.rstrip("/") + "/"
-        subdir_prefix = (zip_root_prefix + subdir.strip("/")).rstrip("/") + "/"
-
-        members = [zi for zi in zf.infolist()
-                   if not zi.is_dir() and zi.filename.startswith(subdir_prefix)]
-        if not members:
-            raise FileNotFoundError(
-                f"Subdirectory '{subdir}' not found in archive at {zip_url}"
-            )
-
-        for zi in members:
-            rel = Path(zi.filename[len(subdir_prefix):])  # path relative to subdir
-            out_path = dest / rel
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            with zf.open(zi) as src, open(out_path, "wb") as dst:
-                dst.write(src.read())
-
-def ensure_docs_present_from_github(root: Path, github_tree_url: str) -> None:
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as tmp:
+        # ZipFile needs a seekable file, so the archive has to land before extraction
+        download_to_file(zip_url, tmp)
+        with zipfile.ZipFile(tmp) as zf:
+            # Normalize prefixes (ensure trailing slashes)
+            zip_root_prefix = zip_root_prefix.rstrip("/") + "/"
+            subdir_prefix = (zip_root_prefix + subdir.strip("/")).rstrip("/") + "/"
+
+            members = [zi for zi in zf.infolist()
+                       if not zi.is_dir() and zi.filename.startswith(subdir_prefix)]
+            if not members:
+                raise FileNotFoundError(
+                    f"Subdirectory '{subdir}' not found in archive at {zip_url}"
+                )
+
+            dest_str = os.fspath(dest)
+            targets = [(zi, os.path.join(dest_str, zi.filename[len(subdir_prefix):])) for zi in members]
+            # Create each distinct parent directory once, up front, so workers never race on mkdir
+            for parent in {os.path.dirname(out_path) for _, out_path in targets}:
+                os.makedirs(parent, exist_ok=True)
+
+            # ZipFile.open() and ZipExtFile.close() update the archive's handle refcount
+            # without locking, so both are serialised here; reading, inflating and
+            # writing each member still run concurrently.
+            refcount_lock = threading.Lock()
+
+            def extract_one(target: Tuple[zipfile.ZipInfo, str]) -> None:
+                zi, out_path = target
+                with refcount_lock:
+                    src = zf.open(zi)
+                try:
+                    with open(out_path, "wb") as dst:
+                        shutil.copyfileobj(src, dst, length=COPY_CHUNK_SIZE)
+                finally:
+                    with refcount_lock:
+                        src.close()
+
+            workers = min(16, (os.cpu_count() or 1) * 2)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+                list(ex.map(extract_one, targets))
+
+def download_and_extract_subdir_from_tar(tar_url: str, tar_root_prefix: str, subdir: str, dest: Path,
+                                         cache_path: Optional[Path] = None) -> None:
+    """
+    Download a repo tarball and extract only files under subdir into dest.
+    The archive is read as a stream, so extraction overlaps with the download.
+    tar_root_prefix is usually '{repo}-{branch}/'. If cache_path is given, the
+    archive is kept there and reused while the server reports it unchanged.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    tar_root_prefix = tar_root_prefix.rstrip("/") + "/"
+    subdir_prefix = (tar_root_prefix + subdir.strip("/")).rstrip("/") + "/"
+
+    dest_str = os.fspath(dest)
+    made_dirs = set()  # parents already created, so each directory costs one makedirs
+    found = False
+    with open_cached_url(tar_url, cache_path) as resp, \
+            gzip.GzipFile(fileobj=resp) as gz, \
+            tarfile.open(fileobj=gz, mode="r|") as tf:
+        for ti in tf:
+            if not ti.isfile() or not ti.name.startswith(subdir_prefix):
+                continue
+            found = True
+            out_path = os.path.join(dest_str, ti.name[len(subdir_prefix):])
+            parent = os.path.dirname(out_path)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
+            with tf.extractfile(ti) as src, open(out_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=COPY_CHUNK_SIZE)
+        # tarfile stops at the end-of-archive marker; read on to the gzip trailer so its
+        # CRC and length are checked and a truncated download raises instead of passing
+        while gz.read(COPY_CHUNK_SIZE):
+            pass
+    if not found:
+        raise FileNotFoundError(
+            f"Subdirectory '{subdir}' not found in archive at {tar_url}"
+        )
+
+def ensure_docs_present_from_github(root: Path, github_tree_url: str,
+                                    cache_dir: Optional[Path] = None) -> None:
     """
     If 'root' doesn't exist or is empty, fetch it from the provided GitHub tree URL.
+    If cache_dir is given, the downloaded tarball is cached there for later runs.
     """
     needs_download = (not root.exists()) or (root.is_dir() and not any(root.iterdir()))
     if not needs_download:
@@ -89,86 +344,192 @@ def ensure_docs_present_from_github(root: Path, github_tree_url: str) -> None:
         # If no subpath given, assume whole repo and use 'docs' by default
         subpath = "docs"
 
-    # codeload URL for the branch ZIP
+    # codeload URLs for the branch tarball and ZIP; both unpack to '{repo}-{branch}/'
+    tar_url = f"https://codeload.github.com/{owner}/{repo}/tar.gz/refs/heads/{branch}"
     zip_url = f"https://codeload.github.com/{owner}/{repo}/zip/refs/heads/{branch}"
-    zip_root_prefix = f"{repo}-{branch}"
+    archive_root_prefix = f"{repo}-{branch}"
+    cache_path = None
+    if cache_dir is not None:
+        # One directory level per name: none of them can contain '/', so keys never collide
+        cache_path = cache_dir / owner / repo / f"{branch}.tar.gz"
 
     print(f"Downloading '{subpath}/' from {owner}/{repo}@{branch} ...")
-    download_and_extract_subdir_from_zip(zip_url, zip_root_prefix, subpath, root)
+    # Extract into a sibling staging directory and move it into place only once complete,
+    # so a failed or truncated download never leaves a partial tree behind in root.
+    root.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{root.name}-", dir=root.parent))
+    try:
+        try:
+            download_and_extract_subdir_from_tar(tar_url, archive_root_prefix, subpath, staging, cache_path)
+        except FileNotFoundError:
+            raise
+        except (OSError, EOFError, zlib.error, tarfile.TarError, http.client.HTTPException) as e:
+            print(f"Warning: tarball download failed ({e}); falling back to ZIP", file=sys.stderr)
+            shutil.rmtree(staging)
+            download_and_extract_subdir_from_zip(zip_url, archive_root_prefix, subpath, staging)
+        # mkdtemp creates the directory as 0700; give it the mode a plain mkdir would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(staging, 0o777 & ~umask)
+        if root.exists():
+            root.rmdir()  # only reached when root is an empty directory
+        os.replace(staging, root)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
     print(f"Downloaded {subpath}/ to {root}")
 
 # ---------------------------
-# Build helpers (unchanged logic)
+# Build helpers
 # ---------------------------
 
+_ANCHOR_DROP_RE = re.compile(r"[^\w\/\-\. ]")
+# Same character class as _ANCHOR_DROP_RE, restricted to ASCII, for str.translate
+_ANCHOR_DROP_ASCII = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c in "_/-. ")
+))
+
+def _scan_files(root: Path,
+                exclude_dirs: set[str],
+                skip_hidden: bool) -> Iterator[os.DirEntry]:
+    """
+    Yield DirEntry objects for all regular files under root, skipping pruned directories.
+    Uses the file type cached by scandir, so no extra stat() is needed per entry.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue  # unreadable directory; os.walk ignores these too
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name
+                    if name not in exclude_dirs and not (skip_hidden and name.startswith(".")):
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
 def find_files(root: Path,
                include_exts: set[str],
-               exclude_dirs: set[str]) -> List[Path]:
-    out: List[Path] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        # prune excluded directories in-place
-        dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
-        for fn in filenames:
-            p = Path(dirpath) / fn
-            if p.suffix.lower() in include_exts:
-                out.append(p)
+               exclude_dirs: set[str],
+               skip_hidden: bool = True) -> List[Path]:
+    # bare lowercase suffixes ("md"), matched against the text after the last dot
+    suffixes = frozenset(e.lstrip(".").lower() for e in include_exts)
+    # scandir paths are root_str + os.sep + relative path; slice instead of relative_to()
+    start = len(os.fspath(root).rstrip(os.sep)) + 1
+    pairs: List[Tuple[str, str]] = []
+    for entry in _scan_files(root, exclude_dirs, skip_hidden):
+        name = entry.name
+        dot = name.rfind(".")
+        if dot > 0 and name[dot + 1:].lower() in suffixes:
+            path = entry.path
+            pairs.append((path[start:].replace(os.sep, "/").lower(), path))
     # sort deterministically by relative path
-    out.sort(key=lambda p: p.relative_to(root).as_posix().lower())
-    return out
+    pairs.sort()
+    return [Path(path) for _, path in pairs]
 
 def md_anchor_from_path(rel_path: Path) -> str:
     # GitHub-ish anchor: lowercase, spaces to '-', drop non-alnum except '-'
-    import re as _re
     s = rel_path.as_posix().lower()
-    s = _re.sub(r"[^\w\/\-\. ]", "", s)
-    s = s.replace(" ", "-")
-    return s
+    # translate is a plain table lookup; only non-ASCII paths need the regex's Unicode \w
+    s = s.translate(_ANCHOR_DROP_ASCII) if s.isascii() else _ANCHOR_DROP_RE.sub("", s)
+    return s.replace(" ", "-")
 
-def make_toc(paths: Iterable[Path], root: Path) -> str:
+def make_toc(entries: Iterable[Tuple[Path, str, str]]) -> str:
     lines = ["## Table of Contents", ""]
-    for p in paths:
-        rel = p.relative_to(root)
-        anchor = md_anchor_from_path(rel)
-        lines.append(f"- [{rel.as_posix()}](#{anchor})")
+    for _, rel_posix, anchor in entries:
+        lines.append(f"- [{rel_posix}](#{anchor})")
     lines.append("")
     return "\n".join(lines)
 
 def read_text_file(p: Path) -> str:
-    # Try utf-8 first, fallback to latin-1 without crashing
-    for enc in ("utf-8", "utf-8-sig", "latin-1"):
+    # Read once; honour a BOM, else try utf-8 and fall back to latin-1 (which never fails).
+    # A plain read beats mmap here: docs are small and every byte gets decoded anyway.
+    data = p.read_bytes()
+    if data.startswith(codecs.BOM_UTF8):
+        text = data[len(codecs.BOM_UTF8):].decode("utf-8", errors="replace")
+    elif data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        text = data.decode("utf-16", errors="replace")
+    else:
         try:
-            return p.read_text(encoding=enc)
-        except Exception:
-            continue
-    # As last resort, read bytes and replace errors
-    return p.read_bytes().decode("utf-8", errors="replace")
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text = data.decode("latin-1")
+    # Universal newlines, as Path.read_text() gives: CRLF and lone CR become LF
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
-def build_document(root: Path, files: List[Path]) -> str:
-    parts: List[str] = []
-    # Header
-    parts.append("# Zama FHEVM Combined Documentation\n")
+def _read_texts(files: List[Path], workers: int) -> Iterator[str]:
+    """
+    Yield read_text_file() for each file in order, keeping at most `workers` reads in
+    flight so memory stays bounded however fast the reads finish.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        pending: collections.deque = collections.deque()
+        for p in files:
+            if len(pending) >= workers:
+                yield pending.popleft().result()
+            pending.append(ex.submit(read_text_file, p))
+        while pending:
+            yield pending.popleft().result()
+
+def _render_section(rel_posix: str, anchor: str, text: str) -> str:
+    # If this is already Markdown (.md/.mdx/.txt), include as-is.
+    # Add a tiny preface line showing the original path.
+    return (
+        f"\n---\n\n"
+        f"## {rel_posix}\n\n"
+        f"<a id=\"{anchor}\"></a>\n\n"
+        f"> _From `{rel_posix}`_\n\n\n"
+        f"{text.rstrip()}\n"  # ensure trailing newline
+    )
+
+def _render_one(entry: Tuple[Path, str, str]) -> str:
+    """
+    Read and render one file's section; the unit of work for --jobs worker processes.
+    """
+    p, rel_posix, anchor = entry
+    return _render_section(rel_posix, anchor, read_text_file(p))
 
-    parts.append(make_toc(files, root))
+def build_document(root: Path, files: List[Path], out: BinaryIO, jobs: int = 1) -> None:
+    """
+    Write the combined document to out (a binary file) piece by piece,
+    instead of assembling the whole document as one string in memory.
+    With jobs > 1, file sections are read and rendered in that many processes.
+    """
+    def emit(s: str) -> None:
+        # newline-separated pieces, as with "\n".join
+        out.write(b"\n")
+        out.write(s.encode("utf-8"))
 
-    # Body
-    for idx, p in enumerate(files, start=1):
-        rel = p.relative_to(root)
-        anchor = md_anchor_from_path(rel)
-        parts.append(f"\n---\n")
-        parts.append(f"## {rel.as_posix()}\n")
-        parts.append(f"<a id=\"{anchor}\"></a>\n")
+    # Header
+    out.write("# Zama FHEVM Combined Documentation\n".encode("utf-8"))
 
-        text = read_text_file(p).rstrip()
+    # (path, relative posix path, anchor), computed once for both the TOC and the body
+    entries: List[Tuple[Path, str, str]] = []
+    for p in files:
+        rel = p.relative_to(root)
+        entries.append((p, rel.as_posix(), md_anchor_from_path(rel)))
 
-        # If this is already Markdown (.md/.mdx/.txt), include as-is.
-        # Add a tiny preface line showing the original path.
-        parts.append(f"> _From `{rel.as_posix()}`_\n")
-        parts.append("")
-        parts.append(text)
-        parts.append("")  # ensure trailing newline
+    emit(make_toc(entries))
 
-    parts.append("\n---\n")
-    return "\n".join(parts)
+    # Body
+    if jobs > 1 and len(entries) > 1:
+        # Only worth it for very large trees: starting the pool costs more than
+        # rendering a typical docs folder. imap keeps results in input order.
+        with multiprocessing.Pool(min(jobs, len(entries))) as pool:
+            for section in pool.imap(_render_one, entries, chunksize=RENDER_CHUNKSIZE):
+                emit(section)
+    else:
+        # Read files with several reads in flight rather than one at a time;
+        # a single-file run reads directly without a thread pool.
+        workers = min(READ_WORKERS, len(files))
+        texts = _read_texts(files, workers) if workers > 1 else map(read_text_file, files)
+        for (p, rel_posix, anchor), text in zip(entries, texts):
+            emit(_render_section(rel_posix, anchor, text))
+
+    emit("\n---\n")
 
 # ---------------------------
 # CLI
@@ -186,15 +547,23 @@ def main():
     ap.add_argument("--ext", action="append",
                     help="Additional file extension to include (can repeat), e.g. --ext .rst")
     ap.add_argument("--no-default-excludes", action="store_true",
-                    help="Do not exclude common folders like .git, .gitbook, node_modules")
+                    help="Do not exclude common folders like .git, .gitbook, node_modules, "
+                         "or hidden folders")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="Always re-download the docs archive instead of reusing the cached copy "
+                         "in ~/.cache/zama-llm-docs")
+    ap.add_argument("--jobs", "-j", type=int, default=1,
+                    help="Worker processes for reading and rendering files; only pays off "
+                         "on very large trees (default: 1, threaded reads in one process)")
     args = ap.parse_args()
 
     root: Path = args.root
     out_path: Path = args.out
 
     # If root is missing/empty, try to fetch it from GitHub
+    cache_dir = None if args.no_cache else default_cache_dir()
     try:
-        ensure_docs_present_from_github(root, args.github)
+        ensure_docs_present_from_github(root, args.github, cache_dir)
     except Exception as e:
         print(f"Warning: could not fetch from GitHub: {e}", file=sys.stderr)
         # Continue; we might already have a local root present
@@ -208,13 +577,21 @@ def main():
 
     exclude_dirs = set() if args.no_default_excludes else set(DEFAULT_EXCLUDE_DIRS)
 
-    files = find_files(root, include_exts, exclude_dirs)
+    files = find_files(root, include_exts, exclude_dirs, skip_hidden=not args.no_default_excludes)
     if not files:
         print("No input files found. Nothing to do.")
         return
 
-    doc = build_document(root, files)
-    out_path.write_text(doc, encoding="utf-8")
+    # Build into a sibling file and swap it in only when complete, so a failure
+    # part-way through never leaves the previous output truncated
+    part_path = out_path.with_name(out_path.name + ".part")
+    try:
+        with open(part_path, "wb", buffering=1 << 20) as out:
+            build_document(root, files, out, jobs=args.jobs)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    os.replace(part_path, out_path)
     print(f"Wrote {out_path.resolve()} with {len(files)} files combined.")
 
 if __name__ == "__main__":